@@ -1,4 +1,4 @@
-from .client import LucidchartClient
+from .client import AsyncLucidchartClient, LucidchartClient
 from .models import (
     Circle,
     Cloud,
@@ -21,6 +21,7 @@ from .models import (
 )
 
 __all__ = [
+    "AsyncLucidchartClient",
     "LucidchartClient",
     "Circle",
     "Cloud",
@@ -1,7 +1,22 @@
-import json
 import re
-from typing import List, Literal, Optional, Any, Union
-from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, Literal, Optional, Tuple, Union
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializeAsAny,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
+
+_COLOR_RE = re.compile(r"#(?:[0-9a-fA-F]{3}){1,2}")
+_ID_ALLOWED = (
+    b"abcdefghijklmnopqrstuvwxyz"
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    b"0123456789-_.~"
+)
 
 
 class Color(str):
@@ -19,7 +34,7 @@ class Color(str):
         """Validate that the color is a valid hexadecimal color code."""
         if not isinstance(v, str):
             raise TypeError("string required")
-        if not re.match(r"^#(?:[0-9a-fA-F]{3}){1,2}$", v):
+        if not _COLOR_RE.fullmatch(v):
             raise ValueError("Invalid color format")
         return v
 
@@ -39,37 +54,32 @@ class ID(str):
         """Validate that the ID is 36 characters long and contains only valid characters."""
         if not isinstance(v, str):
             raise TypeError("string required")
-        if not re.match(r"^[a-zA-Z0-9\-\_\.\~]{1,36}$", v):
+        # bytes.translate with a delete table is a single C pass; anything
+        # left over after deleting the allowed characters is invalid.
+        if not v or len(v) > 36 or v.encode().translate(None, delete=_ID_ALLOWED):
             raise ValueError("Invalid ID format")
         return v
 
 
 class _LucidBase(BaseModel):
     def model_dump_json(self, *, indent=True, ignore_null=True) -> str:
-        def recursive_model_dump(obj: Any) -> Any:
-            if isinstance(obj, BaseModel):
-                return {
-                    k: recursive_model_dump(v)
-                    for k, v in obj.__dict__.items()
-                    if v is not None or not ignore_null or v == 0
-                }
-            elif isinstance(obj, list):
-                return [
-                    recursive_model_dump(item)
-                    for item in obj
-                    if item is not None or not ignore_null or item == 0
-                ]
-            elif isinstance(obj, dict):
-                return {
-                    key: recursive_model_dump(value)
-                    for key, value in obj.items()
-                    if value is not None or not ignore_null or value == 0
-                }
-            else:
-                return obj
-
-        data = recursive_model_dump(self)
-        return json.dumps(data, indent=indent)
+        """Serialize the model to JSON, dropping null fields by default.
+
+        Note that ignore_null only drops None-valued model fields; None
+        items inside lists and None values inside plain dict fields are
+        emitted as null.
+        """
+        return super().model_dump_json(
+            exclude_none=ignore_null, indent=2 if indent else None
+        )
+
+    def model_dump_json_bytes(self, *, ignore_null=True) -> bytes:
+        """Serialize the model straight to compact JSON bytes.
+
+        Skips the UTF-8 decode that model_dump_json pays to return a str,
+        for callers that want bytes anyway (e.g. writing into a zip).
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_none=ignore_null)
 
 
 class LucidBase(_LucidBase):
@@ -88,6 +98,8 @@ class Stroke(_LucidBase):
         'dashed', or 'dotted'.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     width: int = None
     color: str = Field(default=None, pattern=r"^#(?:[0-9a-fA-F]{3}){1,2}$")
     style: Literal["solid", "dashed", "dotted"] = None
@@ -96,10 +108,12 @@ class Stroke(_LucidBase):
 class Style(_LucidBase):
     """Style model to define the look of a shape or line."""
 
+    model_config = ConfigDict(frozen=True)
+
     fill: Union[str, dict] = Field(
         default_factory=lambda: {"type": "color", "color": "#ffffff"}
     )
-    stroke: Optional[Stroke] = Stroke(color="#000000", width=1, style="solid")
+    stroke: Optional[Stroke] = Field(default_factory=lambda: _DEFAULT_STROKE)
     rounding: Optional[int] = None
 
     @field_validator("fill", mode="before")
@@ -109,6 +123,13 @@ class Style(_LucidBase):
         return v
 
 
+# Shared default instances, built once so per-model defaults are copied out
+# of validated singletons instead of re-running the validators on every
+# instantiation.
+_DEFAULT_STROKE = Stroke(color="#000000", width=1, style="solid")
+_DEFAULT_STYLE = Style(stroke=_DEFAULT_STROKE)
+
+
 class Shape(LucidBase):
     # actions: Optional[List[dict]] = []
     # customData: Optional[List[dict]] = []
@@ -125,10 +146,27 @@ class Shape(LucidBase):
         "rightTriangle",
     ]
     text: Optional[str] = ""
-    style: Style = Style()
+    style: Style = Field(default_factory=lambda: _DEFAULT_STYLE.model_copy(deep=True))
     opacity: Optional[int] = None
     note: Optional[str] = None
-    boundingBox: dict = {"x": 0, "y": 0, "w": 50, "h": 50}
+    boundingBox: Tuple[int, int, int, int] = (0, 0, 50, 50)
+
+    @field_validator("boundingBox", mode="before")
+    def bounding_box_from_dict(cls, v):
+        """Accept the dict form {'x': ..., 'y': ..., 'w': ..., 'h': ...}."""
+        if isinstance(v, dict):
+            try:
+                return (v["x"], v["y"], v["w"], v["h"])
+            except KeyError as exc:
+                raise ValueError(
+                    "boundingBox must contain x, y, w, and h"
+                ) from exc
+        return v
+
+    @field_serializer("boundingBox")
+    def serialize_bounding_box(self, v):
+        """Emit the bounding box in the dict form the API expects."""
+        return {"x": v[0], "y": v[1], "w": v[2], "h": v[3]}
 
 
 class Rectangle(Shape):
@@ -195,6 +233,8 @@ class Endpoint(BaseModel):
         _style_ (str): The style of the endpoint.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: str
     style: Literal[
         "none",
@@ -231,6 +271,8 @@ class Text(BaseModel):
         side (Literal['top', 'middle', 'bottom']): The side of the line where the text should appear.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     text: str
     position: float = Field(0.5, ge=0.0, le=1.0)
     side: Literal["top", "middle", "bottom"] = "middle"
@@ -249,10 +291,10 @@ class Line(LucidBase):
     """
 
     lineType: Literal["straight", "curved", "elbow"] = "straight"
-    endpoint1: Endpoint
-    endpoint2: Endpoint
-    stroke: Stroke = Stroke()
-    text: List[Text] = [None]
+    endpoint1: SerializeAsAny[Endpoint]
+    endpoint2: SerializeAsAny[Endpoint]
+    stroke: Stroke = Field(default_factory=Stroke)
+    text: List[Text] = Field(default_factory=list)
 
     def connect_shapes(
         self, shape1: Shape, shape2: Shape, stroke: Stroke = Stroke(), text=None
@@ -279,7 +321,6 @@ class LineEndpoint(Endpoint):
     """
 
     type: str = "lineEndpoint"
-    line: Optional[Line]
     line_id: ID = Field(...)
     position: float
 
@@ -331,10 +372,25 @@ class Page(LucidBase):
     # groups: Optional[List[dict]] = []
     # layers: Optional[List[dict]] = []
     # customData: Optional[List[dict]] = []
-    shapes: List[Shape] = []
+    shapes: List[SerializeAsAny[Shape]] = []
     lines: List[Line] = []
 
 
 class Document(_LucidBase):
     version: int = 1
     pages: List[Page]
+
+    def resolve_line(self, endpoint: LineEndpoint) -> Optional[Line]:
+        """Look up the line a LineEndpoint refers to by its line_id.
+
+        Args:
+            endpoint (LineEndpoint): The endpoint to resolve.
+
+        Returns:
+            Optional[Line]: The matching line, or None if not found.
+        """
+        for page in self.pages:
+            for line in page.lines:
+                if line.id == endpoint.line_id:
+                    return line
+        return None
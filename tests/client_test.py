@@ -1,6 +1,8 @@
+import asyncio
+
 import pytest
 
-from lucidpy.client import LucidchartClient
+from lucidpy.client import AsyncLucidchartClient, LucidchartClient
 
 
 @pytest.fixture
@@ -8,6 +10,11 @@ def client():
     return LucidchartClient(api_key="test-api-key")
 
 
+@pytest.fixture
+def async_client():
+    return AsyncLucidchartClient(api_key="test-api-key")
+
+
 def test_create_document_with_json(client, mocker):
     mock_response = mocker.patch.object(
         client, "_make_request", return_value={"id": "doc1"}
@@ -22,7 +29,47 @@ def test_create_document_with_document(client, mocker):
         client, "_make_request", return_value={"id": "doc1"}
     )
     mock_document = mocker.Mock()
-    mock_document.model_dump_json.return_value = '{"key": "value"}'
+    mock_document.model_dump_json_bytes.return_value = b'{"key": "value"}'
     response = client.create_document(title="Test Document", document=mock_document)
     assert response["id"] == "doc1"
     mock_response.assert_called_once_with("POST", "/documents", files=mocker.ANY)
+
+
+def test_async_create_document_with_json(async_client, mocker):
+    mock_response = mocker.patch.object(
+        async_client, "_make_request", mocker.AsyncMock(return_value={"id": "doc1"})
+    )
+    response = asyncio.run(
+        async_client.create_document(title="Test Document", json='{"key": "value"}')
+    )
+    assert response["id"] == "doc1"
+    mock_response.assert_called_once_with("POST", "/documents", files=mocker.ANY)
+
+
+def test_async_create_document_with_document(async_client, mocker):
+    mock_response = mocker.patch.object(
+        async_client, "_make_request", mocker.AsyncMock(return_value={"id": "doc1"})
+    )
+    mock_document = mocker.Mock()
+    mock_document.model_dump_json_bytes.return_value = b'{"key": "value"}'
+    response = asyncio.run(
+        async_client.create_document(title="Test Document", document=mock_document)
+    )
+    assert response["id"] == "doc1"
+    mock_response.assert_called_once_with("POST", "/documents", files=mocker.ANY)
+
+
+def test_async_create_documents(async_client, mocker):
+    mock_response = mocker.patch.object(
+        async_client,
+        "_make_request",
+        mocker.AsyncMock(side_effect=[{"id": "doc1"}, {"id": "doc2"}, {"id": "doc3"}]),
+    )
+    items = []
+    for i in range(3):
+        mock_document = mocker.Mock()
+        mock_document.model_dump_json_bytes.return_value = b'{"key": "value"}'
+        items.append((f"Test Document {i}", mock_document))
+    responses = asyncio.run(async_client.create_documents(items, concurrency=2))
+    assert [response["id"] for response in responses] == ["doc1", "doc2", "doc3"]
+    assert mock_response.call_count == 3
@@ -276,6 +276,57 @@ def test_page_model():
     assert page.title == "Test Page"
 
 
+def test_default_line_text_round_trips():
+    """Test that a line built without text survives a serialization round trip.
+
+    This test checks that `Line.text` defaults to an empty list, serializes
+    as `[]` rather than `[null]`, and that the resulting JSON is accepted
+    when fed back into the Document model.
+
+    Assertions:
+        - The serialized line's text should be an empty list.
+        - Re-parsing the serialized document should not raise.
+    """
+    line = Line(
+        id="line1",
+        endpoint1=ShapeEndpoint(shapeId=Rectangle(id="shape1")),
+        endpoint2=ShapeEndpoint(shapeId=Rectangle(id="shape2")),
+    )
+    page = Page(id="page1", title="Test Page", lines=[line])
+    document = Document(pages=[page])
+
+    data = json.loads(document.model_dump_json())
+    assert data["pages"][0]["lines"][0]["text"] == []
+    Document(**data)
+
+
+def test_resolve_line():
+    """Test resolving a LineEndpoint back to its Line by line_id.
+
+    This test checks that `Document.resolve_line` finds the line a
+    `LineEndpoint` refers to, and returns None when no line matches.
+
+    Assertions:
+        - The endpoint should resolve to the line with the matching id.
+        - An endpoint with an unknown line_id should resolve to None.
+    """
+    shape1 = Rectangle(id="shape1")
+    shape2 = Rectangle(id="shape2")
+    line = Line(
+        id="line1",
+        endpoint1=ShapeEndpoint(shapeId=shape1),
+        endpoint2=ShapeEndpoint(shapeId=shape2),
+    )
+    page = Page(id="page1", title="Test Page", shapes=[shape1, shape2], lines=[line])
+    document = Document(pages=[page])
+
+    endpoint = LineEndpoint(line_id="line1", position=0.5)
+    assert document.resolve_line(endpoint) is line
+
+    missing = LineEndpoint(line_id="line2", position=0.5)
+    assert document.resolve_line(missing) is None
+
+
 def test_full_document() -> None:
     # create the full document with two shapes and a line connecting them
     document = Document(version=1, pages=[])